@@ -1,11 +1,11 @@
 import json
-import requests
-from typing import Dict, List
+import httpx
+from typing import Dict, Iterator, List
 
 
 class FrappeClient(object):
     """Client to interact with the Frappe API.
-    
+
     Attributes:
         domain (str): Path to Frappe domain to use (e.g. https://mindsdbfrappe.com).
         access_token (str): Frappe authorization token to use for all API requests.
@@ -22,25 +22,58 @@ class FrappeClient(object):
         self.headers = {
             'Authorization': f'token {self.access_token}',
         }
+        # One HTTP/2 client per Frappe instance: requests reuse a keep-alive
+        # connection and concurrent requests are multiplexed over it instead
+        # of each paying its own TCP+TLS setup. No timeout, matching the
+        # previous requests-based behavior: large get_documents responses can
+        # legitimately take longer than httpx's 5-second default.
+        self._client = httpx.Client(
+            http2=True,
+            headers=self.headers,
+            timeout=httpx.Timeout(None),
+            limits=httpx.Limits(max_keepalive_connections=10))
+
+    def close(self):
+        """Closes the underlying HTTP connection pool."""
+        self._client.close()
+
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Sends a request, following a redirect manually if the server issues one.
+
+        Frappe deployments commonly redirect, and we have to re-issue the
+        request ourselves to preserve the 'Authorization' header (automatic
+        following would drop it).
+        See https://github.com/request/request/pull/1184/commits/210b326fd8625f358e06c59dc11e74468b1de515.
+        """
+        response = self._client.request(method, url, **kwargs)
+        if response.is_redirect:
+            redirect_url = response.headers.get('location', None)
+            if redirect_url is None:
+                raise httpx.HTTPError('Could not find redirect URL')
+            response = self._client.request(method, redirect_url, **kwargs)
+        return response
 
     def get_document(self, doctype: str, name: str) -> Dict:
         """Gets a document matching the given doctype from Frappe.
-        
+
         See https://frappeframework.com/docs/v14/user/en/api/rest#listing-documents
         Args:
             doctype (str): The document type to retrieve.
             name (str): Name of the document.
         """
-        document_response = requests.get(
-            f'{self.base_url}/resource/{doctype}/{name}',
-            headers=self.headers)
-        if not document_response.ok:
+        document_response = self._request(
+            'GET',
+            f'{self.base_url}/resource/{doctype}/{name}')
+        if not document_response.is_success:
             document_response.raise_for_status()
         return document_response.json()['data']
 
-    def get_documents(self, doctype: str, limit: int = None, fields: List[str] = None, filters: List[List] = None) -> List[Dict]:
+    def get_documents(self, doctype: str, limit: int = None, fields: List[str] = None, filters: List[List] = None) -> Iterator[Dict]:
         """Gets all documents matching the given doctype from Frappe.
-        
+
+        Yields documents one at a time so callers can stream large result
+        sets without buffering them in an intermediate list.
+
         See https://frappeframework.com/docs/v14/user/en/api/rest#listing-documents
         Args:
             doctype (str): The document type to retrieve.
@@ -56,26 +89,13 @@ class FrappeClient(object):
             params['filters'] = json.dumps(filters)
         if fields is not None:
             params['fields'] = json.dumps(fields)
-        documents_response = requests.get(
+        documents_response = self._request(
+            'GET',
             f'{self.base_url}/resource/{doctype}/',
-            params=params,
-            headers=self.headers,
-            allow_redirects=False)
-        if documents_response.is_redirect:
-            # We have to manually redirect to preserve the 'Authorization' header.
-            # See https://github.com/request/request/pull/1184/commits/210b326fd8625f358e06c59dc11e74468b1de515.
-            redirect_url = documents_response.headers.get('location', None)
-            if redirect_url is None:
-                raise requests.HTTPError('Could not find redirect URL')
-            documents_response = requests.get(
-                redirect_url,
-                params=params,
-                headers=self.headers,
-                allow_redirects=False)
-
-        if not documents_response.ok:
+            params=params)
+        if not documents_response.is_success:
             documents_response.raise_for_status()
-        return documents_response.json()['data']
+        yield from documents_response.json()['data']
 
     def post_document(
             self,
@@ -83,28 +103,28 @@ class FrappeClient(object):
             data: Dict):
         """Creates a new document of the given doctype.
         See https://frappeframework.com/docs/v14/user/en/api/rest#listing-documents
-        
+
         Args:
             doctype (str): Type of the document to create.
             data (Dict): Document object.
         """
-        post_response = requests.post(
+        post_response = self._request(
+            'POST',
             f'{self.base_url}/resource/{doctype}',
-            json=data,
-            headers=self.headers)
-        if not post_response.ok:
+            json=data)
+        if not post_response.is_success:
             post_response.raise_for_status()
         return post_response.json()['data']
 
     def ping(self) -> bool:
         """Sends a basic request to the Frappe API to see if it succeeds.
-        
+
         Returns whether or not the connection to the Frappe API is valid.
         See https://frappeframework.com/docs/v14/user/en/api/rest#1-token-based-authentication
         """
 
         # No ping or similar endpoint exists, so we'll try getting the logged in user.
-        user_response = requests.get(
-            f'{self.base_url}/method/frappe.auth.get_logged_user',
-            headers=self.headers)
-        return user_response.ok
+        user_response = self._request(
+            'GET',
+            f'{self.base_url}/method/frappe.auth.get_logged_user')
+        return user_response.is_success
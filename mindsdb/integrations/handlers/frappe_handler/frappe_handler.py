@@ -1,7 +1,16 @@
+from __future__ import annotations
+
+import copy
+import functools
 import json
-import pandas as pd
+import orjson
 import datetime as dt
-from typing import Dict
+import sys
+import types
+from typing import Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from mindsdb.integrations.handlers.frappe_handler.frappe_tables import FrappeDocumentsTable
 from mindsdb.integrations.handlers.frappe_handler.frappe_client import FrappeClient
@@ -11,7 +20,32 @@ from mindsdb.integrations.libs.response import (
     HandlerResponse as Response,
 )
 from mindsdb.utilities import log
-from mindsdb_sql import parse_sql
+
+_REQUIRED_CONNECTION_ARGS = ('access_token', 'domain')
+
+# Interned once so the result-frame dicts hash these keys by pointer
+# instead of re-hashing the string on every construction.
+_DOCTYPE_KEY = sys.intern('doctype')
+_DATA_KEY = sys.intern('data')
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(query: str):
+    # Deferred so registered-but-unused handlers don't pay the parser's
+    # import cost in every worker process.
+    from mindsdb_sql import parse_sql
+
+    return parse_sql(query, dialect='mindsdb')
+
+
+# The back-office tool descriptions are constant, so they are built once at
+# import time and shared (read-only) across all calls.
+_TOOLS = types.MappingProxyType({
+    'register_sales_invoice': 'have to be used by assistant to register a sales invoice. Input is JSON object serialized as a string. Due date have to be passed in format: "yyyy-mm-dd".',
+    'check_company_exists': 'useful to check the company is exist. Input is company',
+    'check_expense_type': 'useful to check the expense_type is exist. Input is expense_type',
+    'check_customer':  'useful to check the customer is exist. Input is customer',
+})
 
 
 class FrappeHandler(APIHandler):
@@ -35,10 +69,9 @@ class FrappeHandler(APIHandler):
         self.is_connected = False
 
         args = kwargs.get('connection_data', {})
-        if not 'access_token' in args:
-            raise ValueError('"access_token" parameter required for authentication')
-        if not 'domain' in args:
-            raise ValueError('"domain" parameter required to connect to your Frappe instance')
+        missing = [key for key in _REQUIRED_CONNECTION_ARGS if key not in args]
+        if missing:
+            raise ValueError(f'Missing required connection parameters: {", ".join(missing)}')
         self.access_token = args['access_token']
         self.domain = args['domain']
 
@@ -46,16 +79,15 @@ class FrappeHandler(APIHandler):
         self._register_table('documents', document_data)
         self.connection_data = args
 
-    def back_office_config(self):
-        tools = {
-            'register_sales_invoice': 'have to be used by assistant to register a sales invoice. Input is JSON object serialized as a string. Due date have to be passed in format: "yyyy-mm-dd".',
-            'check_company_exists': 'useful to check the company is exist. Input is company',
-            'check_expense_type': 'useful to check the expense_type is exist. Input is expense_type',
-            'check_customer':  'useful to check the customer is exist. Input is customer',
-
+        self._frappe_methods = {
+            'get_documents': self._get_documents,
+            'get_document': self._get_document,
+            'create_document': self._create_document,
         }
+
+    def back_office_config(self):
         return {
-            'tools': tools,
+            'tools': _TOOLS,
         }
 
     def register_sales_invoice(self, data):
@@ -101,21 +133,21 @@ class FrappeHandler(APIHandler):
 
     def check_company_exists(self, name):
         self.connect()
-        result = self.client.get_documents('Company', filters=[['name', '=', name]])
+        result = list(self.client.get_documents('Company', filters=[['name', '=', name]]))
         if len(result) == 1:
             return True
         return "Company doesn't exist: please use different name"
 
     def check_expense_type(self, name):
         self.connect()
-        result = self.client.get_documents('Expense Claim Type', filters=[['name', '=', name]])
+        result = list(self.client.get_documents('Expense Claim Type', filters=[['name', '=', name]]))
         if len(result) == 1:
             return True
         return "Expense Claim Type doesn't exist: please use different name"
 
     def check_customer(self, name):
         self.connect()
-        result = self.client.get_documents('Customer', filters=[['name', '=', name]])
+        result = list(self.client.get_documents('Customer', filters=[['name', '=', name]]))
         if len(result) == 1:
             return True
         return "Customer doesn't exist"
@@ -128,7 +160,10 @@ class FrappeHandler(APIHandler):
         if self.is_connected is True and self.client:
             return self.client
 
-        if self.domain and self.access_token:
+        # Reuse an existing client after e.g. a failed check_connection
+        # reset is_connected; it owns a socket pool that would otherwise
+        # leak on every rebuild.
+        if self.client is None and self.domain and self.access_token:
             self.client = FrappeClient(self.domain, self.access_token)
 
         self.is_connected = True
@@ -155,20 +190,58 @@ class FrappeHandler(APIHandler):
         return response
 
     def native_query(self, query: str = None) -> Response:
-        ast = parse_sql(query, dialect='mindsdb')
+        # Downstream query execution may mutate the AST, so hand out a copy
+        # of the cached parse result.
+        ast = copy.deepcopy(_parse_cached(query))
         return self.query(ast)
 
-    def _document_to_dataframe_row(self, doctype, document: Dict) -> Dict:
-        return {
-            'doctype': doctype,
-            'data': json.dumps(document)
-        }
+    def _documents_to_dataframe(self, doctype: str, documents, size_hint: int = None) -> pd.DataFrame:
+        """Serializes streamed documents into the columnar result frame.
+
+        Streams documents into a preallocated object array instead of
+        buffering the whole result set in a Python list first. When the
+        length is unknown, grows the buffer by doubling.
+        """
+        import numpy as np
+        import pandas as pd
+
+        # size_hint comes from the user-supplied LIMIT, so cap the upfront
+        # allocation and let the doubling below grow to the actual size.
+        size = min(size_hint, 4096) if size_hint else 256
+        data_arr = np.empty(size, dtype=object)
+        n = 0
+        for document in documents:
+            if n == size:
+                size *= 2
+                grown = np.empty(size, dtype=object)
+                grown[:n] = data_arr
+                data_arr = grown
+            data_arr[n] = orjson.dumps(document).decode('utf-8')
+            n += 1
+        # Every row shares the same doctype, so store the column as a
+        # categorical: one byte of codes per row plus a single category
+        # string, rather than n object references.
+        doctype_col = pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[doctype])
+        return pd.DataFrame({_DOCTYPE_KEY: doctype_col, _DATA_KEY: data_arr[:n]}, copy=False)
 
     def _get_document(self, params: Dict = None) -> pd.DataFrame:
+        if 'names' in params:
+            # Several documents requested by name: fetch them in one
+            # filtered list call instead of one round trip each.
+            return self._get_documents_by_names(params)
+        import pandas as pd
+
         client = self.connect()
         doctype = params['doctype']
         document = client.get_document(doctype, params['name'])
-        return pd.DataFrame.from_records([self._document_to_dataframe_row(doctype, document)])
+        return pd.DataFrame({_DOCTYPE_KEY: [doctype], _DATA_KEY: [orjson.dumps(document).decode('utf-8')]}, copy=False)
+
+    def _get_documents_by_names(self, params: Dict = None) -> pd.DataFrame:
+        client = self.connect()
+        doctype = params['doctype']
+        names = list(params['names'])
+        documents = client.get_documents(doctype, limit=len(names), filters=[['name', 'in', names]])
+        return self._documents_to_dataframe(doctype, documents, size_hint=len(names))
 
     def _get_documents(self, params: Dict = None) -> pd.DataFrame:
         client = self.connect()
@@ -177,13 +250,15 @@ class FrappeHandler(APIHandler):
         filters = params.get('filters', None)
         fields = params.get('fields', None)
         documents = client.get_documents(doctype, limit=limit, fields=fields, filters=filters)
-        return pd.DataFrame.from_records([self._document_to_dataframe_row(doctype, d) for d in documents])
+        return self._documents_to_dataframe(doctype, documents, size_hint=limit)
 
     def _create_document(self, params: Dict = None) -> pd.DataFrame:
+        import pandas as pd
+
         client = self.connect()
         doctype = params['doctype']
-        new_document = client.post_document(doctype, json.loads(params['data']))
-        return pd.DataFrame.from_records([self._document_to_dataframe_row(doctype, new_document)])
+        new_document = client.post_document(doctype, orjson.loads(params['data']))
+        return pd.DataFrame({_DOCTYPE_KEY: [doctype], _DATA_KEY: [orjson.dumps(new_document).decode('utf-8')]}, copy=False)
 
     def call_frappe_api(self, method_name: str = None, params: Dict = None) -> pd.DataFrame:
         """Calls the Frappe API method with the given params.
@@ -194,10 +269,7 @@ class FrappeHandler(APIHandler):
             method_name (str): Method name to call (e.g. get_document)
             params (Dict): Params to pass to the API call
         """
-        if method_name == 'get_documents':
-            return self._get_documents(params)
-        if method_name == 'get_document':
-            return self._get_document(params)
-        if method_name == 'create_document':
-            return self._create_document(params)
-        raise NotImplementedError('Method name {} not supported by Frappe API Handler'.format(method_name))
+        api_method = self._frappe_methods.get(method_name)
+        if api_method is None:
+            raise NotImplementedError('Method name {} not supported by Frappe API Handler'.format(method_name))
+        return api_method(params)
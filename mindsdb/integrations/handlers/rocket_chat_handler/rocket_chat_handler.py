@@ -1,5 +1,17 @@
-import pandas as pd
-from typing import Dict, List
+from __future__ import annotations
+
+import copy
+import functools
+import orjson
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from rocketchat_API.rocketchat import RocketChat
 
@@ -11,7 +23,73 @@ from mindsdb.integrations.libs.response import (
     HandlerResponse as Response,
 )
 from mindsdb.utilities import log
-from mindsdb_sql import parse_sql
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(query: str):
+    # Deferred so registered-but-unused handlers don't pay the parser's
+    # import cost in every worker process.
+    from mindsdb_sql import parse_sql
+
+    return parse_sql(query, dialect='mindsdb')
+
+
+# Any one of these credential groups is enough to authenticate; earlier
+# groups take precedence when several are supplied.
+_AUTH_ARG_GROUPS = (
+    ('token', 'user_id'),
+    ('username', 'password'),
+)
+
+
+# Handlers pointing at the same server with the same credentials share one
+# RocketChat client (and therefore one keep-alive connection pool), instead
+# of each instance re-doing the TCP+TLS handshake. Values are held weakly:
+# handler instances keep their client alive via self.client, and entries
+# whose handlers are all gone expire on their own.
+_CLIENT_CACHE: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# One process-wide pool for batched API calls: concurrent pollers reuse a
+# small set of warm threads instead of each batch spawning (and tearing
+# down) its own thread stacks.
+_BATCH_EXECUTOR = ThreadPoolExecutor(max_workers=20, thread_name_prefix='rocket_chat_batch')
+
+
+class _TokenBucket:
+    """A thread-safe token bucket used to pace Rocket Chat API calls.
+
+    Attributes:
+        rate (float): Tokens replenished per second.
+        burst (int): Maximum number of tokens the bucket can hold.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate: float, burst: int = None):
+        """Updates the replenishment rate, e.g. from server rate limit headers."""
+        with self._lock:
+            self.rate = rate
+            if burst is not None:
+                self.burst = burst
+
+    def acquire(self, tokens: int = 1):
+        """Blocks until the given number of tokens is available, then takes them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
 
 
 class RocketChatHandler(APIChatHandler):
@@ -45,18 +123,29 @@ class RocketChatHandler(APIChatHandler):
             raise ValueError('Must include Rocket Chat "domain" to read and write messages')
         self.domain = args['domain']
 
-        if 'token' in args and 'user_id' in args:
+        for group in _AUTH_ARG_GROUPS:
+            if all(key in args for key in group):
+                auth_group = group
+                break
+        else:
+            raise ValueError('Need "token" and "user_id", or "username" and "password" to connect to Rocket Chat')
+
+        if auth_group == ('token', 'user_id'):
             self.auth_token = args['token']
             self.auth_user_id = args['user_id']
-        elif 'username' in args and 'password' in args:
+        else:
             self.username = args['username']
             self.password = args['password']
-        else:
-            raise ValueError('Need "token" and "user_id", or "username" and "password" to connect to Rocket Chat')
 
         self.client = None
         self.is_connected = False
 
+        # Conservative default pace until the server advertises its actual
+        # limit via x-ratelimit-* response headers.
+        self._limiter = _TokenBucket(rate=10.0, burst=20)
+        self._method_cache: Dict[str, Callable] = {}
+        self._my_username = None
+
         self._register_table('channels', ChannelsTable(self))
 
         self._register_table('channel_messages', ChannelMessagesTable(self))
@@ -85,8 +174,12 @@ class RocketChatHandler(APIChatHandler):
         return params
 
     def get_my_user_name(self):
-        info = self.call_api('me')
-        return info['username']
+        # The authenticated username never changes within a session, so one
+        # 'me' call per handler is enough.
+        if self._my_username is None:
+            info = self.call_api('me')
+            self._my_username = info['username']
+        return self._my_username
 
     def connect(self):
         """Creates a new Rocket Chat API client if needed and sets it as the client to use for requests.
@@ -96,14 +189,25 @@ class RocketChatHandler(APIChatHandler):
         if self.is_connected and self.client is not None:
             return self.client
 
-        self.client = RocketChat(
-            user=self.username,
-            password=self.password,
-            auth_token=self.auth_token,
-            user_id=self.auth_user_id,
-            server_url=self.domain
-        )
-
+        # The full credential set belongs in the key so that e.g. a rotated
+        # password misses the cache instead of reusing a stale session.
+        key = (self.domain, self.auth_token, self.auth_user_id, self.username, self.password)
+        with _CLIENT_CACHE_LOCK:
+            client = _CLIENT_CACHE.get(key)
+            if client is None:
+                client = RocketChat(
+                    user=self.username,
+                    password=self.password,
+                    auth_token=self.auth_token,
+                    user_id=self.auth_user_id,
+                    server_url=self.domain
+                )
+                _CLIENT_CACHE[key] = client
+
+        if client is not self.client:
+            # Bound methods cached from a previous client are stale.
+            self._method_cache.clear()
+        self.client = client
         self.is_connected = True
         return self.client
 
@@ -127,7 +231,9 @@ class RocketChatHandler(APIChatHandler):
         return response
 
     def native_query(self, query: str = None) -> Response:
-        ast = parse_sql(query, dialect='mindsdb')
+        # Downstream query execution may mutate the AST, so hand out a copy
+        # of the cached parse result.
+        ast = copy.deepcopy(_parse_cached(query))
         return self.query(ast)
 
 
@@ -142,10 +248,60 @@ class RocketChatHandler(APIChatHandler):
         """
         client = self.connect()
 
-        method = getattr(client, method_name)
-
-        messages_response = method(*args, **kwargs)
+        method = self._method_cache.get(method_name)
+        if method is None:
+            method = self._method_cache.setdefault(method_name, getattr(client, method_name))
+
+        for _ in range(5):
+            self._limiter.acquire()
+            messages_response = method(*args, **kwargs)
+
+            limit_header = messages_response.headers.get('x-ratelimit-limit')
+            if limit_header is not None:
+                try:
+                    limit = int(limit_header)
+                except ValueError:
+                    pass
+                else:
+                    # Rocket Chat rate limit windows default to one minute.
+                    # A non-positive limit would stall the bucket forever,
+                    # so only accept sane values.
+                    if limit > 0:
+                        self._limiter.set_rate(limit / 60.0, burst=limit)
+
+            if messages_response.status_code == 429:
+                # Wait the server-advertised backoff instead of losing the
+                # call. Retry-After may also be an HTTP-date, which we treat
+                # as the default backoff.
+                try:
+                    retry_after = float(messages_response.headers.get('retry-after', 1.0))
+                except ValueError:
+                    retry_after = 1.0
+                time.sleep(retry_after)
+                continue
+            break
 
         if not messages_response.ok:
             messages_response.raise_for_status()
-        return messages_response.json()
+        # orjson decodes the raw bytes considerably faster than the stdlib
+        # json used by Response.json().
+        return orjson.loads(messages_response.content)
+
+    def call_api_batch(self, calls: List[Tuple]) -> List[Dict]:
+        """Fans multiple Rocket Chat API calls out concurrently.
+
+        Issuing calls one at a time serializes on network round trips, so
+        fetching e.g. the history of N rooms costs N RTTs; fanning out over
+        a bounded pool brings that close to a single RTT.
+
+        Args:
+            calls (List[Tuple]): Calls to make, each a tuple of
+                (method_name, args, kwargs)
+
+        Returns results in the same order as the given calls.
+        """
+        futures = [
+            _BATCH_EXECUTOR.submit(self.call_api, method_name, *args, **kwargs)
+            for method_name, args, kwargs in calls
+        ]
+        return [future.result() for future in futures]